@@ -1,5 +1,3 @@
-import logging
-
 import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import climate, ble_client
@@ -15,7 +13,6 @@ from .. import (
     register_bedjet_child,
 )
 
-_LOGGER = logging.getLogger(__name__)
 CODEOWNERS = ["@jhansche"]
 DEPENDENCIES = ["bedjet"]
 
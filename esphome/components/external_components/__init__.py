@@ -1,4 +1,3 @@
-import logging
 from pathlib import Path
 
 import esphome.config_validation as cv
@@ -19,8 +18,6 @@ from esphome.const import (
 )
 from esphome.core import CORE
 
-_LOGGER = logging.getLogger(__name__)
-
 DOMAIN = CONF_EXTERNAL_COMPONENTS
 
 
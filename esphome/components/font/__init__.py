@@ -5,8 +5,6 @@ import os
 import re
 from packaging import version
 
-import requests
-
 from esphome import core
 import esphome.config_validation as cv
 import esphome.codegen as cg
@@ -36,32 +34,45 @@ Glyph = font_ns.class_("Glyph")
 GlyphData = font_ns.struct("GlyphData")
 
 
+GLYPH_LIST_SCHEMA = cv.Schema([cv.string])
+
+
 def validate_glyphs(value):
-    if isinstance(value, list):
-        value = cv.Schema([cv.string])(value)
-    value = cv.Schema([cv.string])(list(value))
-
-    def comparator(x, y):
-        x_ = x.encode("utf-8")
-        y_ = y.encode("utf-8")
-
-        for c in range(min(len(x_), len(y_))):
-            if x_[c] < y_[c]:
-                return -1
-            if x_[c] > y_[c]:
-                return 1
-
-        if len(x_) < len(y_):
-            return -1
-        if len(x_) > len(y_):
-            return 1
-        raise cv.Invalid(f"Found duplicate glyph {x}")
-
-    value.sort(key=functools.cmp_to_key(comparator))
+    if isinstance(value, str):
+        return list(_parse_glyph_string(value))
+    if not isinstance(value, list):
+        value = list(value)
+    return _sort_glyphs(GLYPH_LIST_SCHEMA(value))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_glyph_string(value):
+    # Every font without explicit glyphs validates the same DEFAULT_GLYPHS
+    # string, so the sorted result is computed once and shared.
+    return tuple(_sort_glyphs(list(value)))
+
+
+def _sort_glyphs(value):
+    # The firmware expects glyphs in UTF-8 byte order. UTF-8 preserves code
+    # point order, so plain string sorting gives the same order without
+    # encoding every glyph, and leaves duplicates next to each other.
+    value.sort()
+    duplicates = dict.fromkeys(
+        glyph for prev, glyph in zip(value, value[1:]) if prev == glyph
+    )
+    if duplicates:
+        raise cv.Invalid(f"Found duplicate glyph {', '.join(duplicates)}")
     return value
 
 
 def validate_pillow_installed(value):
+    # The installed Pillow can't change during a run
+    _check_pillow_installed()
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _check_pillow_installed():
     try:
         import PIL
     except ImportError as err:
@@ -81,8 +92,6 @@ def validate_pillow_installed(value):
             '(pip install pillow">4.0.0,<10.0.0")'
         )
 
-    return value
-
 
 def validate_truetype_file(value):
     if value.endswith(".zip"):  # for Google Fonts downloads
@@ -137,8 +146,14 @@ FONT_WEIGHTS = {
 }
 
 
+FONT_WEIGHT_NAME = cv.one_of(*FONT_WEIGHTS, lower=True, space="-")
+
+
 def validate_weight_name(value):
-    return FONT_WEIGHTS[cv.one_of(*FONT_WEIGHTS, lower=True, space="-")(value)]
+    return FONT_WEIGHTS[FONT_WEIGHT_NAME(value)]
+
+
+GFONTS_CSS_URL_RE = re.compile(r"src:\s+url\((.+)\)\s+format\('truetype'\);")
 
 
 def download_gfonts(value):
@@ -151,6 +166,9 @@ def download_gfonts(value):
     path = _compute_gfonts_local_path(value)
     if path.is_file():
         return value
+
+    import requests
+
     try:
         req = requests.get(url, timeout=30)
         req.raise_for_status()
@@ -159,7 +177,7 @@ def download_gfonts(value):
             f"Could not download font for {name}, please check the fonts exists "
             f"at google fonts ({e})"
         )
-    match = re.search(r"src:\s+url\((.+)\)\s+format\('truetype'\);", req.text)
+    match = GFONTS_CSS_URL_RE.search(req.text)
     if match is None:
         raise cv.Invalid(
             f"Could not extract ttf file from gfonts response for {name}, "
@@ -190,10 +208,13 @@ GFONTS_SCHEMA = cv.All(
 )
 
 
+GFONTS_SHORTHAND_RE = re.compile(r"^gfonts://([^@]+)(@.+)?$")
+
+
 def validate_file_shorthand(value):
     value = cv.string_strict(value)
     if value.startswith("gfonts://"):
-        match = re.match(r"^gfonts://([^@]+)(@.+)?$", value)
+        match = GFONTS_SHORTHAND_RE.match(value)
         if match is None:
             raise cv.Invalid("Could not parse gfonts shorthand syntax, please check it")
         family = match.group(1)
@@ -204,17 +225,17 @@ def validate_file_shorthand(value):
         }
         if weight is not None:
             data[CONF_WEIGHT] = weight[1:]
-        return FILE_SCHEMA(data)
+        return TYPED_FILE_SCHEMA(data)
 
-    if value.endswith(".pcf") or value.endswith(".bdf"):
-        return FILE_SCHEMA(
+    if value.endswith((".pcf", ".bdf")):
+        return TYPED_FILE_SCHEMA(
             {
                 CONF_TYPE: TYPE_LOCAL_BITMAP,
                 CONF_PATH: value,
             }
         )
 
-    return FILE_SCHEMA(
+    return TYPED_FILE_SCHEMA(
         {
             CONF_TYPE: TYPE_LOCAL,
             CONF_PATH: value,
@@ -245,6 +266,10 @@ DEFAULT_GLYPHS = (
 )
 CONF_RAW_GLYPH_ID = "raw_glyph_id"
 
+# Point lookup table turning a grayscale glyph mask into a mono one, where
+# any non-zero pixel is set.
+MASK_TO_MONO = [0] + [255] * 255
+
 FONT_SCHEMA = cv.Schema(
     {
         cv.Required(CONF_ID): cv.declare_id(Font),
@@ -281,12 +306,19 @@ class BitmapFontWrapper:
     def __init__(self, font):
         self.font = font
         self.max_height = 0
+        self.masks = {}
 
     def getoffset(self, glyph):
         return 0, 0
 
     def getmask(self, glyph, **kwargs):
-        return self.font.getmask(glyph, **kwargs)
+        # getmetrics() already renders every glyph, keep the masks around so
+        # to_code doesn't have to render them a second time.
+        key = (glyph, tuple(kwargs.items()))
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = self.masks[key] = self.font.getmask(glyph, **kwargs)
+        return mask
 
     def getmetrics(self, glyphs):
         max_height = 0
@@ -326,6 +358,10 @@ def convert_bitmap_to_pillow_font(filepath):
     return cv.file_(local_pil_font_file)
 
 
+# Several font entries commonly share one file (e.g. a family in a few sizes).
+# Loading is deterministic per path and size, so parse and convert each font
+# only once per run.
+@functools.lru_cache(maxsize=None)
 def load_bitmap_font(filepath):
     from PIL import ImageFont
 
@@ -342,6 +378,7 @@ def load_bitmap_font(filepath):
     return BitmapFontWrapper(font)
 
 
+@functools.lru_cache(maxsize=None)
 def load_ttf_font(path, size):
     from PIL import ImageFont
 
@@ -354,6 +391,8 @@ def load_ttf_font(path, size):
 
 
 async def to_code(config):
+    from PIL import Image
+
     conf = config[CONF_FILE]
     if conf[CONF_TYPE] == TYPE_LOCAL_BITMAP:
         font = load_bitmap_font(CORE.relative_config_path(conf[CONF_PATH]))
@@ -369,39 +408,38 @@ async def to_code(config):
     ascent, descent = font.getmetrics(config[CONF_GLYPHS])
 
     glyph_args = {}
-    data = []
+    data = bytearray()
     for glyph in config[CONF_GLYPHS]:
         mask = font.getmask(glyph, mode="1")
         offset_x, offset_y = font.getoffset(glyph)
         width, height = mask.size
-        width8 = ((width + 7) // 8) * 8
-        glyph_data = [0] * (height * width8 // 8)
-        for y in range(height):
-            for x in range(width):
-                if not mask.getpixel((x, y)):
-                    continue
-                pos = x + y * width8
-                glyph_data[pos // 8] |= 0x80 >> (pos % 8)
+        # Raw mode "1" data already has the row-padded layout the firmware expects
+        image = Image.Image()._new(mask)  # pylint: disable=protected-access
+        if image.mode != "1":
+            image = image.point(MASK_TO_MONO, "1")
         glyph_args[glyph] = (len(data), offset_x, offset_y, width, height)
-        data += glyph_data
+        data += image.tobytes()
 
-    rhs = [HexInt(x) for x in data]
+    # Build the array expression straight from the bytes, going through a
+    # list of HexInt first would keep another full copy of the font alive.
+    rhs = cg.ArrayInitializer(*map(HexInt, data))
     prog_arr = cg.progmem_array(config[CONF_RAW_DATA_ID], rhs)
 
+    prog_arr_name = str(prog_arr)
     glyph_initializer = []
-    for glyph in config[CONF_GLYPHS]:
+    for glyph, (offset, offset_x, offset_y, width, height) in glyph_args.items():
         glyph_initializer.append(
             cg.StructInitializer(
                 GlyphData,
                 ("a_char", glyph),
                 (
                     "data",
-                    cg.RawExpression(f"{str(prog_arr)} + {str(glyph_args[glyph][0])}"),
+                    cg.RawExpression(f"{prog_arr_name} + {offset}"),
                 ),
-                ("offset_x", glyph_args[glyph][1]),
-                ("offset_y", glyph_args[glyph][2]),
-                ("width", glyph_args[glyph][3]),
-                ("height", glyph_args[glyph][4]),
+                ("offset_x", offset_x),
+                ("offset_y", offset_y),
+                ("width", width),
+                ("height", height),
             )
         )
 
@@ -1,5 +1,3 @@
-import logging
-
 from esphome.const import (
     CONF_ID,
     CONF_INPUT,
@@ -18,9 +16,6 @@ import esphome.codegen as cg
 from .const import host_ns
 
 
-_LOGGER = logging.getLogger(__name__)
-
-
 HostGPIOPin = host_ns.class_("HostGPIOPin", cg.InternalGPIOPin)
 
 
@@ -1,3 +1,4 @@
+import re
 import urllib.parse as urlparse
 
 import esphome.codegen as cg
@@ -35,8 +36,16 @@ CONF_FOLLOW_REDIRECTS = "follow_redirects"
 CONF_REDIRECT_LIMIT = "redirect_limit"
 
 
+# URLs with a plain host and an explicit path come back from urlparse() and
+# urlunparse() unchanged. Matching them directly skips the round-trip for
+# the common case; anything else takes the full path below.
+PLAIN_URL_RE = re.compile(r"https?://[\w.~%!$&'()*+,=:@-]+/[^\s?#;]*", re.ASCII)
+
+
 def validate_url(value):
     value = cv.string(value)
+    if PLAIN_URL_RE.fullmatch(value):
+        return value
     try:
         parsed = list(urlparse.urlparse(value))
     except Exception as err:
@@ -122,6 +131,15 @@ HTTP_REQUEST_ACTION_SCHEMA = cv.Schema(
         ),
     }
 ).add_extra(validate_secure_url)
+HTTP_REQUEST_BODY_SCHEMA = cv.Schema(
+    {
+        cv.Exclusive(CONF_BODY, "body"): cv.templatable(cv.string),
+        cv.Exclusive(CONF_JSON, "body"): cv.Any(
+            cv.lambda_,
+            cv.All(cv.Schema({cv.string: cv.templatable(cv.string_strict)})),
+        ),
+    }
+)
 HTTP_REQUEST_GET_ACTION_SCHEMA = automation.maybe_conf(
     CONF_URL,
     HTTP_REQUEST_ACTION_SCHEMA.extend(
@@ -135,12 +153,8 @@ HTTP_REQUEST_POST_ACTION_SCHEMA = automation.maybe_conf(
     HTTP_REQUEST_ACTION_SCHEMA.extend(
         {
             cv.Optional(CONF_METHOD, default="POST"): cv.one_of("POST", upper=True),
-            cv.Exclusive(CONF_BODY, "body"): cv.templatable(cv.string),
-            cv.Exclusive(CONF_JSON, "body"): cv.Any(
-                cv.lambda_,
-                cv.All(cv.Schema({cv.string: cv.templatable(cv.string_strict)})),
-            ),
-        }
+        },
+        HTTP_REQUEST_BODY_SCHEMA,
     ),
 )
 HTTP_REQUEST_SEND_ACTION_SCHEMA = HTTP_REQUEST_ACTION_SCHEMA.extend(
@@ -148,12 +162,8 @@ HTTP_REQUEST_SEND_ACTION_SCHEMA = HTTP_REQUEST_ACTION_SCHEMA.extend(
         cv.Required(CONF_METHOD): cv.one_of(
             "GET", "POST", "PUT", "DELETE", "PATCH", upper=True
         ),
-        cv.Exclusive(CONF_BODY, "body"): cv.templatable(cv.string),
-        cv.Exclusive(CONF_JSON, "body"): cv.Any(
-            cv.lambda_,
-            cv.All(cv.Schema({cv.string: cv.templatable(cv.string_strict)})),
-        ),
-    }
+    },
+    HTTP_REQUEST_BODY_SCHEMA,
 )
 
 
@@ -173,23 +183,20 @@ async def http_request_action_to_code(config, action_id, template_arg, args):
     template_ = await cg.templatable(config[CONF_URL], args, cg.std_string)
     cg.add(var.set_url(template_))
     cg.add(var.set_method(config[CONF_METHOD]))
-    if CONF_BODY in config:
-        template_ = await cg.templatable(config[CONF_BODY], args, cg.std_string)
+    if (body := config.get(CONF_BODY)) is not None:
+        template_ = await cg.templatable(body, args, cg.std_string)
         cg.add(var.set_body(template_))
-    if CONF_JSON in config:
-        json_ = config[CONF_JSON]
+    if (json_ := config.get(CONF_JSON)) is not None:
         if isinstance(json_, Lambda):
             args_ = args + [(cg.JsonObject, "root")]
             lambda_ = await cg.process_lambda(json_, args_, return_type=cg.void)
             cg.add(var.set_json(lambda_))
         else:
-            for key in json_:
-                template_ = await cg.templatable(json_[key], args, cg.std_string)
+            for key, value in json_.items():
+                template_ = await cg.templatable(value, args, cg.std_string)
                 cg.add(var.add_json(key, template_))
-    for key in config.get(CONF_HEADERS, []):
-        template_ = await cg.templatable(
-            config[CONF_HEADERS][key], args, cg.const_char_ptr
-        )
+    for key, value in config.get(CONF_HEADERS, {}).items():
+        template_ = await cg.templatable(value, args, cg.const_char_ptr)
         cg.add(var.add_header(key, template_))
 
     for conf in config.get(CONF_ON_RESPONSE, []):
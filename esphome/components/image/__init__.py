@@ -1,9 +1,9 @@
+import functools
 import logging
 
 import io
 from pathlib import Path
 import re
-import requests
 
 from esphome import core
 from esphome.components import font
@@ -39,6 +39,8 @@ IMAGE_TYPE = {
     "RGB24": ImageType.IMAGE_TYPE_RGB24,
     "RGBA": ImageType.IMAGE_TYPE_RGBA,
 }
+BINARY_IMAGE_TYPES = frozenset({"BINARY", "TRANSPARENT_BINARY"})
+TRANSPARENT_IMAGE_TYPES = frozenset({"TRANSPARENT_BINARY", "RGBA"})
 
 CONF_USE_TRANSPARENCY = "use_transparency"
 
@@ -61,6 +63,9 @@ def download_mdi(value):
     path = _compute_local_icon_path(value)
     if path.is_file():
         return value
+
+    import requests
+
     url = f"https://raw.githubusercontent.com/Templarian/MaterialDesign/master/svg/{mdi_id}.svg"
     _LOGGER.debug("Downloading %s MDI image from %s", mdi_id, url)
     try:
@@ -76,6 +81,12 @@ def download_mdi(value):
 
 def validate_cairosvg_installed(value):
     """Validate that cairosvg is installed"""
+    _check_cairosvg_installed()
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _check_cairosvg_installed():
     try:
         import cairosvg
     except ImportError as err:
@@ -91,8 +102,6 @@ def validate_cairosvg_installed(value):
             "(pip install -U cairosvg)"
         )
 
-    return value
-
 
 def validate_cross_dependencies(config):
     """
@@ -109,7 +118,7 @@ def validate_cross_dependencies(config):
             config[CONF_TYPE] = "BINARY"
 
     image_type = config[CONF_TYPE]
-    is_transparent_type = image_type in ["TRANSPARENT_BINARY", "RGBA"]
+    is_transparent_type = image_type in TRANSPARENT_IMAGE_TYPES
 
     # If the use_transparency option was not specified, set the default depending on the image type
     if CONF_USE_TRANSPARENCY not in config:
@@ -118,7 +127,7 @@ def validate_cross_dependencies(config):
     if is_transparent_type and not config[CONF_USE_TRANSPARENCY]:
         raise cv.Invalid(f"Image type {image_type} must always be transparent.")
 
-    if is_mdi and config[CONF_TYPE] not in ["BINARY", "TRANSPARENT_BINARY"]:
+    if is_mdi and config[CONF_TYPE] not in BINARY_IMAGE_TYPES:
         raise cv.Invalid("MDI images must be binary images.")
 
     return config
@@ -201,6 +210,11 @@ IMAGE_SCHEMA = cv.Schema(
 CONFIG_SCHEMA = cv.All(font.validate_pillow_installed, IMAGE_SCHEMA)
 
 
+def _transparent_pixels(alpha):
+    """Return a mode "1" mask of the pixels drawn as transparent."""
+    return alpha.point(lambda a: 255 if a < 0x80 else 0, "1")
+
+
 def load_svg_image(file: str, resize: tuple[int, int]):
     from PIL import Image
 
@@ -223,7 +237,7 @@ def load_svg_image(file: str, resize: tuple[int, int]):
 
 
 async def to_code(config):
-    from PIL import Image
+    from PIL import Image, ImageChops
 
     conf_file = config[CONF_FILE]
 
@@ -257,96 +271,70 @@ async def to_code(config):
 
     dither = Image.NONE if config[CONF_DITHER] == "NONE" else Image.FLOYDSTEINBERG
     if config[CONF_TYPE] == "GRAYSCALE":
-        image = image.convert("LA", dither=dither)
-        pixels = list(image.getdata())
-        data = [0 for _ in range(height * width)]
-        pos = 0
-        for g, a in pixels:
-            if transparent:
-                if g == 1:
-                    g = 0
-                if a < 0x80:
-                    g = 1
-
-            data[pos] = g
-            pos += 1
+        gray, alpha = image.convert("LA", dither=dither).split()
+        if transparent:
+            # Gray level 1 is reserved to mark transparent pixels
+            gray = gray.point(lambda g: 0 if g == 1 else g)
+            gray.paste(1, mask=_transparent_pixels(alpha))
+        data = gray.tobytes()
 
     elif config[CONF_TYPE] == "RGBA":
-        image = image.convert("RGBA")
-        pixels = list(image.getdata())
-        data = [0 for _ in range(height * width * 4)]
-        pos = 0
-        for r, g, b, a in pixels:
-            data[pos] = r
-            pos += 1
-            data[pos] = g
-            pos += 1
-            data[pos] = b
-            pos += 1
-            data[pos] = a
-            pos += 1
+        data = image.convert("RGBA").tobytes()
 
     elif config[CONF_TYPE] == "RGB24":
         image = image.convert("RGBA")
-        pixels = list(image.getdata())
-        data = [0 for _ in range(height * width * 3)]
-        pos = 0
-        for r, g, b, a in pixels:
-            if transparent:
-                if r == 0 and g == 0 and b == 1:
-                    b = 0
-                if a < 0x80:
-                    r = 0
-                    g = 0
-                    b = 1
-
-            data[pos] = r
-            pos += 1
-            data[pos] = g
-            pos += 1
-            data[pos] = b
-            pos += 1
-
-    elif config[CONF_TYPE] in ["RGB565"]:
-        image = image.convert("RGBA")
-        pixels = list(image.getdata())
-        data = [0 for _ in range(height * width * 2)]
-        pos = 0
-        for r, g, b, a in pixels:
-            R = r >> 3
-            G = g >> 2
-            B = b >> 3
-            rgb = (R << 11) | (G << 5) | B
-
-            if transparent:
-                if rgb == 0x0020:
-                    rgb = 0
-                if a < 0x80:
-                    rgb = 0x0020
-
-            data[pos] = rgb >> 8
-            pos += 1
-            data[pos] = rgb & 0xFF
-            pos += 1
-
-    elif config[CONF_TYPE] in ["BINARY", "TRANSPARENT_BINARY"]:
+        alpha = image.getchannel("A")
+        image = image.convert("RGB")
+        if transparent:
+            # The color (0, 0, 1) is reserved to mark transparent pixels
+            r, g, b = image.split()
+            key = ImageChops.logical_and(
+                ImageChops.logical_and(
+                    r.point(lambda v: 255 if v == 0 else 0, "1"),
+                    g.point(lambda v: 255 if v == 0 else 0, "1"),
+                ),
+                b.point(lambda v: 255 if v == 1 else 0, "1"),
+            )
+            image.paste((0, 0, 0), mask=key)
+            image.paste((0, 0, 1), mask=_transparent_pixels(alpha))
+        data = image.tobytes()
+
+    elif config[CONF_TYPE] == "RGB565":
+        r, g, b, alpha = image.convert("RGBA").split()
+        # Build the high and low byte of every RGB565 value as separate
+        # channels, the bit fields don't overlap so adding them is an OR.
+        high = ImageChops.add(r.point(lambda v: v & 0xF8), g.point(lambda v: v >> 5))
+        low = ImageChops.add(
+            g.point(lambda v: (v << 3) & 0xE0), b.point(lambda v: v >> 3)
+        )
+        if transparent:
+            # The color 0x0020 is reserved to mark transparent pixels
+            key = ImageChops.logical_and(
+                high.point(lambda v: 255 if v == 0 else 0, "1"),
+                low.point(lambda v: 255 if v == 0x20 else 0, "1"),
+            )
+            low.paste(0, mask=key)
+            mask = _transparent_pixels(alpha)
+            high.paste(0, mask=mask)
+            low.paste(0x20, mask=mask)
+        # Interleave the two channels into big-endian 16 bit values
+        data = Image.merge("LA", (high, low)).tobytes()
+
+    elif config[CONF_TYPE] in BINARY_IMAGE_TYPES:
         if transparent:
             alpha = image.split()[-1]
             has_alpha = alpha.getextrema()[0] < 0xFF
             _LOGGER.debug("%s Has alpha: %s", config[CONF_ID], has_alpha)
-        image = image.convert("1", dither=dither)
-        width8 = ((width + 7) // 8) * 8
-        data = [0 for _ in range(height * width8 // 8)]
-        for y in range(height):
-            for x in range(width):
-                if transparent and has_alpha:
-                    a = alpha.getpixel((x, y))
-                    if not a:
-                        continue
-                elif image.getpixel((x, y)):
-                    continue
-                pos = x + y * width8
-                data[pos // 8] |= 0x80 >> (pos % 8)
+        if transparent and has_alpha:
+            # Set the bits of all pixels that aren't fully transparent
+            if alpha.mode not in ("1", "L", "P"):
+                alpha = alpha.convert("L")
+            if alpha.mode != "1":
+                alpha = alpha.point(lambda a: 255 if a else 0, "1")
+            data = alpha.tobytes()
+        else:
+            # Set the bits of all black pixels
+            data = ImageChops.invert(image.convert("1", dither=dither)).tobytes()
     else:
         raise core.EsphomeError(
             f"Image f{config[CONF_ID]} has an unsupported type: {config[CONF_TYPE]}."
@@ -3,7 +3,6 @@ import esphome.codegen as cg
 import esphome.config_validation as cv
 from esphome.components import modbus
 from esphome.const import CONF_ADDRESS, CONF_ID, CONF_NAME, CONF_LAMBDA, CONF_OFFSET
-from esphome.cpp_helpers import logging
 from .const import (
     CONF_BITMASK,
     CONF_BYTE_OFFSET,
@@ -96,8 +95,6 @@ TYPE_REGISTER_MAP = {
 
 MULTI_CONF = True
 
-_LOGGER = logging.getLogger(__name__)
-
 CONFIG_SCHEMA = cv.All(
     cv.Schema(
         {
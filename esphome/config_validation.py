@@ -1243,6 +1243,13 @@ def one_of(*values, **kwargs):
     if kwargs:
         raise ValueError
 
+    try:
+        # Options are almost always strings or numbers, a set turns the
+        # membership test into a single hash lookup.
+        lookup = frozenset(values)
+    except TypeError:
+        lookup = values
+
     @schema_extractor("one_of")
     def validator(value):
         if value == SCHEMA_EXTRACT:
@@ -1259,7 +1266,12 @@ def one_of(*values, **kwargs):
             value = Lower(value)
         if upper:
             value = Upper(value)
-        if value not in values:
+        try:
+            found = value in lookup
+        except TypeError:
+            # Unhashable input, e.g. a list given where a scalar is expected
+            found = value in values
+        if not found:
             import difflib
 
             options_ = [str(x) for x in values]
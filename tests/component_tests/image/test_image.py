@@ -0,0 +1,45 @@
+"""Tests for the image component."""
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "expected",
+    (
+        "static const uint8_t binary_data[] PROGMEM = {0xE0, 0xD0};",
+        "static const uint8_t binary_transparent_data[] PROGMEM = {0xF0, 0xB0};",
+        "static const uint8_t transparent_binary_data[] PROGMEM = {0xF0, 0xB0};",
+        "static const uint8_t grayscale_data[] PROGMEM = "
+        "{0x00, 0x02, 0x01, 0x9F, 0x7C, 0x12, 0xFF, 0x00};",
+        "static const uint8_t grayscale_transparent_data[] PROGMEM = "
+        "{0x00, 0x02, 0x00, 0x01, 0x7C, 0x01, 0xFF, 0x00};",
+        "static const uint8_t rgb565_data[] PROGMEM = "
+        "{0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0xFC, 0x08, "
+        "0xCB, 0x26, 0x08, 0xA3, 0xFF, 0xFF, 0x00, 0x00};",
+        "static const uint8_t rgb565_transparent_data[] PROGMEM = "
+        "{0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, "
+        "0xCB, 0x26, 0x00, 0x20, 0xFF, 0xFF, 0x00, 0x00};",
+        "static const uint8_t rgb24_data[] PROGMEM = "
+        "{0x00, 0x00, 0x01, 0x00, 0x04, 0x00, 0x01, 0x01, 0x01, 0xFF, 0x80, 0x40, "
+        "0xC8, 0x64, 0x32, 0x0A, 0x14, 0x1E, 0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00};",
+        "static const uint8_t rgb24_transparent_data[] PROGMEM = "
+        "{0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x01, 0x01, 0x01, 0x00, 0x00, 0x01, "
+        "0xC8, 0x64, 0x32, 0x00, 0x00, 0x01, 0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00};",
+        "static const uint8_t rgba_data[] PROGMEM = "
+        "{0x00, 0x00, 0x01, 0xFF, 0x00, 0x04, 0x00, 0xFF, "
+        "0x01, 0x01, 0x01, 0xFF, 0xFF, 0x80, 0x40, 0x7F, "
+        "0xC8, 0x64, 0x32, 0x80, 0x0A, 0x14, 0x1E, 0x00, "
+        "0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0x00, 0x00, 0xFF};",
+    ),
+)
+def test_image_data(generate_main, expected):
+    """
+    Every image type should encode the pixels of the test image, with and without transparency
+    """
+    # Given
+
+    # When
+    main_cpp = generate_main("tests/component_tests/image/test_image.yaml")
+
+    # Then
+    assert expected in main_cpp
@@ -145,6 +145,29 @@ def test_boolean__invalid(value):
         config_validation.boolean(value)
 
 
+@pytest.mark.parametrize("value", ("bmp", "Png", "JPEG"))
+def test_one_of__valid(value):
+    validator = config_validation.one_of("BMP", "PNG", "JPEG", upper=True)
+
+    assert validator(value) == value.upper()
+
+
+@pytest.mark.parametrize("value", ("GIF", ["BMP"], {"PNG": 1}))
+def test_one_of__invalid(value):
+    validator = config_validation.one_of("BMP", "PNG", "JPEG")
+
+    with pytest.raises(Invalid, match="Unknown value"):
+        validator(value)
+
+
+def test_one_of__unhashable_options():
+    validator = config_validation.one_of([1, 2], [3])
+
+    assert validator([3]) == [3]
+    with pytest.raises(Invalid, match="Unknown value"):
+        validator([4])
+
+
 # TODO: ensure_list
 @given(integers())
 def hex_int__valid(value):
@@ -0,0 +1,34 @@
+import pytest
+
+from esphome.components import font
+from esphome.config_validation import Invalid
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        (["b", "ab", "a", "€", "💡"], ["a", "ab", "b", "€", "💡"]),
+        ("b€a💡", ["a", "b", "€", "💡"]),
+        (["°C", "°", "°F"], ["°", "°C", "°F"]),
+        (["ä", "z", "A"], ["A", "z", "ä"]),
+        ("", []),
+    ),
+)
+def test_validate_glyphs__valid(value, expected):
+    actual = font.validate_glyphs(value)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    (
+        (["a", "b", "a"], "Found duplicate glyph a"),
+        ("aba", "Found duplicate glyph a"),
+        (["b", "a", "€", "b", "a", "€"], "Found duplicate glyph a, b, €"),
+        ("ba€ba€", "Found duplicate glyph a, b, €"),
+    ),
+)
+def test_validate_glyphs__invalid(value, expected):
+    with pytest.raises(Invalid, match=expected):
+        font.validate_glyphs(value)